@@ -0,0 +1,16 @@
+D65X, D65Y, D65Z = 0.95047, 1.0, 1.08883
+# u'/v' chromaticity of the D65 white point, used by CIELuv.
+U_D65 = 4 * D65X / (D65X + 15 * D65Y + 3 * D65Z)
+V_D65 = 9 * D65Y / (D65X + 15 * D65Y + 3 * D65Z)
+M_RGB2XYZ = (
+    (0.4124564, 0.3575761, 0.1804375),
+    (0.2126729, 0.7151522, 0.0721750),
+    (0.0193339, 0.1191920, 0.9503041),
+)
+M_XYZ2RGB = (
+    (3.2404542, -1.5371385, -0.4985314),
+    (-0.9692660, 1.8760108, 0.0415560),
+    (0.0556434, -0.2040259, 1.0572252),
+)
+# Positions of (C, X, 0) in (R, G, B) for each 60-degree hue sector.
+HSV_SECTORS = ((0, 1, 2), (1, 0, 2), (2, 0, 1), (2, 1, 0), (1, 2, 0), (0, 2, 1))
@@ -0,0 +1,47 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+from libc.math cimport pow
+
+from ._constants import M_RGB2XYZ
+
+cdef enum:
+    LUT_SIZE = 1024
+
+cdef double _lut[LUT_SIZE]
+cdef double _m[3][3]
+
+
+cdef double _expand(double c) noexcept nogil:
+    if c <= 0.04045:
+        return c / 12.92
+    return pow((c + 0.055) / 1.055, 2.4)
+
+
+cdef inline double gamma_expand(double c) noexcept nogil:
+    # Linear interpolation over the LUT is accurate to well under 1 LSB at 8 bits;
+    # values outside [0, 1), and NaN, fall back to the exact curve.
+    cdef double x
+    cdef int i
+    if not (0.0 <= c < 1.0):
+        return _expand(c)
+    x = c * (LUT_SIZE - 1)
+    i = <int>x
+    return _lut[i] + (x - i) * (_lut[i + 1] - _lut[i])
+
+
+cdef int i, j
+for i in range(LUT_SIZE):
+    _lut[i] = _expand(<double>i / (LUT_SIZE - 1))
+for i in range(3):
+    for j in range(3):
+        _m[i][j] = M_RGB2XYZ[i][j]
+
+
+def srgb_to_xyz(double r, double g, double b):
+    r = gamma_expand(r)
+    g = gamma_expand(g)
+    b = gamma_expand(b)
+    return (
+        _m[0][0] * r + _m[0][1] * g + _m[0][2] * b,
+        _m[1][0] * r + _m[1][1] * g + _m[1][2] * b,
+        _m[2][0] * r + _m[2][1] * g + _m[2][2] * b,
+    )
@@ -0,0 +1,143 @@
+from math import floor, isfinite
+
+from numpy import cbrt as np_cbrt, empty_like, ndarray
+
+from ._constants import D65X, D65Y, D65Z, HSV_SECTORS, M_RGB2XYZ, M_XYZ2RGB
+
+try:
+    from math import cbrt
+except ImportError:  # Python < 3.11
+
+    def cbrt(x: float) -> float:
+        return x ** (1 / 3)
+
+
+try:
+    from numba import njit, prange
+
+    NUMBA = True
+    # numba can't compile math.cbrt, but it lowers np.cbrt on scalars to libm cbrt.
+    njit_cbrt = np_cbrt
+except ImportError:  # numba is optional; fall back to plain Python
+    NUMBA = False
+    prange = range
+    njit_cbrt = cbrt
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def gamma_expand(c: float) -> float:
+    if c <= 0.04045:
+        return c / 12.92
+    return ((c + 0.055) / 1.055) ** 2.4
+
+
+@njit(cache=True)
+def gamma_compress(c: float) -> float:
+    if c <= 0.0031308:
+        return 12.92 * c
+    return 1.055 * c ** (1 / 2.4) - 0.055
+
+
+@njit(cache=True)
+def srgb_to_xyz(_R: float, _G: float, _B: float) -> tuple[float, float, float]:
+    r = gamma_expand(_R)
+    g = gamma_expand(_G)
+    b = gamma_expand(_B)
+    x, y, z = M_RGB2XYZ
+    return (
+        x[0] * r + x[1] * g + x[2] * b,
+        y[0] * r + y[1] * g + y[2] * b,
+        z[0] * r + z[1] * g + z[2] * b,
+    )
+
+
+@njit(cache=True)
+def xyz_to_srgb(_X: float, _Y: float, _Z: float) -> tuple[float, float, float]:
+    r, g, b = M_XYZ2RGB
+    return (
+        gamma_compress(r[0] * _X + r[1] * _Y + r[2] * _Z),
+        gamma_compress(g[0] * _X + g[1] * _Y + g[2] * _Z),
+        gamma_compress(b[0] * _X + b[1] * _Y + b[2] * _Z),
+    )
+
+
+@njit(cache=True)
+def xyz_to_lab(_X: float, _Y: float, _Z: float) -> tuple[float, float, float]:
+    tx = _X / D65X
+    ty = _Y / D65Y
+    tz = _Z / D65Z
+    fx = njit_cbrt(tx) if tx > 216 / 24389 else 841 / 108 * tx + 4 / 29
+    fy = njit_cbrt(ty) if ty > 216 / 24389 else 841 / 108 * ty + 4 / 29
+    fz = njit_cbrt(tz) if tz > 216 / 24389 else 841 / 108 * tz + 4 / 29
+    return 116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)
+
+
+@njit(cache=True)
+def lab_to_xyz(_L: float, _a: float, _b: float) -> tuple[float, float, float]:
+    fy = (_L + 16) / 116
+    fx = fy + _a / 500
+    fz = fy - _b / 200
+    tx = fx * fx * fx if fx > 6 / 29 else 108 / 841 * (fx - 4 / 29)
+    ty = fy * fy * fy if fy > 6 / 29 else 108 / 841 * (fy - 4 / 29)
+    tz = fz * fz * fz if fz > 6 / 29 else 108 / 841 * (fz - 4 / 29)
+    return D65X * tx, D65Y * ty, D65Z * tz
+
+
+@njit(cache=True)
+def srgb_to_hsv(_R: float, _G: float, _B: float) -> tuple[float, float, float]:
+    _M = max(_R, _G, _B)
+    m = min(_R, _G, _B)
+    _C = _M - m
+    if _C == 0:
+        _H = 0.0
+    elif _M == _R:
+        _H = 60 * ((_G - _B) / _C % 6)
+    elif _M == _G:
+        _H = 60 * ((_B - _R) / _C + 2)
+    else:
+        _H = 60 * ((_R - _G) / _C + 4)
+    _S = 0.0 if _M == 0 else _C / _M
+    return _H, _S, _M
+
+
+@njit(cache=True)
+def hsv_to_srgb(_H: float, _S: float, _V: float) -> tuple[float, float, float]:
+    _C = float(_V * _S)
+    _H /= 60
+    _X = _C * (1 - abs(_H % 2 - 1))
+    m = _V - _C
+    triple = (_C, _X, 0.0)
+    # A NaN/inf hue lands in the last sector, as the original if-ladder's else did.
+    r, g, b = HSV_SECTORS[floor(_H) % 6 if isfinite(_H) else 5]
+    return triple[r] + m, triple[g] + m, triple[b] + m
+
+
+@njit(cache=True, parallel=True)
+def xyz_to_lab_arr(
+    _X: ndarray, _Y: ndarray, _Z: ndarray
+) -> tuple[ndarray, ndarray, ndarray]:
+    _L = empty_like(_X)
+    a = empty_like(_X)
+    b = empty_like(_X)
+    for i in prange(_X.shape[0]):
+        _L[i], a[i], b[i] = xyz_to_lab(_X[i], _Y[i], _Z[i])
+    return _L, a, b
+
+
+@njit(cache=True, parallel=True)
+def srgb_to_lab_fused(
+    _R: ndarray,
+    _G: ndarray,
+    _B: ndarray,
+    out_L: ndarray,
+    out_a: ndarray,
+    out_b: ndarray,
+) -> None:
+    for i in prange(_R.shape[0]):
+        _X, _Y, _Z = srgb_to_xyz(_R[i], _G[i], _B[i])
+        out_L[i], out_a[i], out_b[i] = xyz_to_lab(_X, _Y, _Z)
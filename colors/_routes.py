@@ -0,0 +1,22 @@
+from typing import Iterable
+
+
+def route(conversions: Iterable[tuple[str, str]], src: str, dst: str) -> list[str]:
+    """
+    Shortest chain of color spaces from ``src`` to ``dst``.
+
+    :param conversions: the available direct conversions, as ``(src, dst)`` pairs
+    :param src: name of the source color space
+    :param dst: name of the target color space
+    :return: the spaces along the route, starting with ``src`` and ending with ``dst``
+    """
+    paths = {src: [src]}
+    queue = [src]
+    for space in queue:
+        if space == dst:
+            return paths[space]
+        for a, b in conversions:
+            if a == space and b not in paths:
+                paths[b] = paths[space] + [b]
+                queue.append(b)
+    raise ValueError(f"No conversion from {src} to {dst}")
@@ -0,0 +1,344 @@
+from typing import Optional
+
+from numpy import (
+    absolute,
+    array,
+    ascontiguousarray,
+    cbrt,
+    choose,
+    clip,
+    empty,
+    float32,
+    float64,
+    floor,
+    int8,
+    int32,
+    int64,
+    isfinite,
+    linspace,
+    ndarray,
+    rint,
+    uint8,
+    uint16,
+    stack,
+    where,
+    zeros_like,
+)
+
+from ._constants import (
+    D65X,
+    D65Y,
+    D65Z,
+    HSV_SECTORS,
+    M_RGB2XYZ,
+    M_XYZ2RGB,
+)
+from ._kernels import NUMBA, srgb_to_lab_fused, xyz_to_lab_arr
+from ._routes import route
+
+# Stored transposed (and C-contiguous) so ``arr @ _M_T`` walks contiguous rows.
+_M_RGB2XYZ_T = array(M_RGB2XYZ).T.copy()
+_M_XYZ2RGB_T = array(M_XYZ2RGB).T.copy()
+# float32 copies, so float32 images stay float32 end to end.
+_M_RGB2XYZ_T32 = _M_RGB2XYZ_T.astype(float32)
+_M_XYZ2RGB_T32 = _M_XYZ2RGB_T.astype(float32)
+
+# Pixels per tile in the unfused srgb_to_lab path: 4096 x 3 float64 is 96 KiB per
+# stage, so the temporaries of each stage fit in L2.
+_TILE = 4096
+
+Channels = tuple[ndarray, ndarray, ndarray]
+
+
+def _floating(arr: ndarray) -> ndarray:
+    # float32 input is computed in float32; anything else in float64.
+    return arr if arr.dtype == float32 else arr.astype(float64, copy=False)
+
+
+def gamma_expand(c: ndarray) -> ndarray:
+    """
+    Elementwise sRGB gamma expansion (companded to linear).
+
+    :param c: companded sRGB channel values
+    :return: linear values with the same shape as ``c``
+    """
+    return where(c <= 0.04045, c / 12.92, ((absolute(c) + 0.055) / 1.055) ** 2.4)
+
+
+def gamma_compress(c: ndarray) -> ndarray:
+    """
+    Elementwise sRGB gamma compression (linear to companded).
+
+    :param c: linear sRGB channel values
+    :return: companded values with the same shape as ``c``
+    """
+    return where(c <= 0.0031308, 12.92 * c, 1.055 * absolute(c) ** (1 / 2.4) - 0.055)
+
+
+def lab_f(t: ndarray) -> ndarray:
+    """
+    Elementwise CIELab ``f()``, applied to white-point-normalized XYZ.
+
+    :param t: normalized tristimulus values
+    :return: ``f(t)`` with the same shape as ``t``
+    """
+    return where(t > 216 / 24389, cbrt(t), 841 / 108 * t + 4 / 29)
+
+
+def lab_f_inv(t: ndarray) -> ndarray:
+    """
+    Elementwise inverse of ``lab_f``.
+
+    :param t: ``f()`` values
+    :return: normalized tristimulus values with the same shape as ``t``
+    """
+    return where(t > 6 / 29, t * t * t, 108 / 841 * (t - 4 / 29))
+
+
+def _srgb_to_xyz(_R: ndarray, _G: ndarray, _B: ndarray) -> Channels:
+    r, g, b = gamma_expand(_R), gamma_expand(_G), gamma_expand(_B)
+    x, y, z = M_RGB2XYZ
+    return (
+        x[0] * r + x[1] * g + x[2] * b,
+        y[0] * r + y[1] * g + y[2] * b,
+        z[0] * r + z[1] * g + z[2] * b,
+    )
+
+
+def _xyz_to_srgb(_X: ndarray, _Y: ndarray, _Z: ndarray) -> Channels:
+    r, g, b = M_XYZ2RGB
+    return (
+        gamma_compress(r[0] * _X + r[1] * _Y + r[2] * _Z),
+        gamma_compress(g[0] * _X + g[1] * _Y + g[2] * _Z),
+        gamma_compress(b[0] * _X + b[1] * _Y + b[2] * _Z),
+    )
+
+
+def _xyz_to_cielab(_X: ndarray, _Y: ndarray, _Z: ndarray) -> Channels:
+    if NUMBA:
+        _X, _Y, _Z = _floating(_X), _floating(_Y), _floating(_Z)
+        _L, a, b = xyz_to_lab_arr(_X.ravel(), _Y.ravel(), _Z.ravel())
+        return _L.reshape(_X.shape), a.reshape(_X.shape), b.reshape(_X.shape)
+    fx = lab_f(_X / D65X)
+    fy = lab_f(_Y / D65Y)
+    fz = lab_f(_Z / D65Z)
+    return 116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)
+
+
+def _cielab_to_xyz(_L: ndarray, _a: ndarray, _b: ndarray) -> Channels:
+    fy = (_L + 16) / 116
+    return (
+        D65X * lab_f_inv(fy + _a / 500),
+        D65Y * lab_f_inv(fy),
+        D65Z * lab_f_inv(fy - _b / 200),
+    )
+
+
+def _srgb_to_cielab(_R: ndarray, _G: ndarray, _B: ndarray) -> Channels:
+    if not NUMBA:
+        return _xyz_to_cielab(*_srgb_to_xyz(_R, _G, _B))
+    _R, _G, _B = _floating(_R), _floating(_G), _floating(_B)
+    # C-ordered, so ravel() is a view the kernel can write through.
+    _L = empty(_R.shape, _R.dtype)
+    a = empty(_R.shape, _R.dtype)
+    b = empty(_R.shape, _R.dtype)
+    srgb_to_lab_fused(
+        _R.ravel(), _G.ravel(), _B.ravel(), _L.ravel(), a.ravel(), b.ravel()
+    )
+    return _L, a, b
+
+
+def _hsv_to_srgb(_H: ndarray, _S: ndarray, _V: ndarray) -> Channels:
+    _C = _V * _S
+    _H = _H / 60
+    _X = _C * (1 - absolute(_H % 2 - 1))
+    m = _V - _C
+    triple = (_C, _X, zeros_like(_C))
+    # NaN/inf hues take the last sector, matching the scalar conversion.
+    sector = where(isfinite(_H), floor(_H) % 6, 5).astype(int8)
+    return (
+        choose(sector, [triple[s[0]] for s in HSV_SECTORS]) + m,
+        choose(sector, [triple[s[1]] for s in HSV_SECTORS]) + m,
+        choose(sector, [triple[s[2]] for s in HSV_SECTORS]) + m,
+    )
+
+
+_conversions = {
+    ("sRGB", "XYZ"): _srgb_to_xyz,
+    ("sRGB", "CIELab"): _srgb_to_cielab,
+    ("XYZ", "sRGB"): _xyz_to_srgb,
+    ("XYZ", "CIELab"): _xyz_to_cielab,
+    ("CIELab", "XYZ"): _cielab_to_xyz,
+    ("HSV", "sRGB"): _hsv_to_srgb,
+}
+
+
+class BatchColor:
+    """
+    Many colors in one space, stored as three parallel channel arrays.
+
+    Keeping each channel contiguous lets every conversion step run as unit-stride
+    array operations, and code that only needs one channel (e.g. ``Y`` for
+    luminance) touches a third of the memory an ``(N, 3)`` array would.
+    """
+
+    __slots__ = ("space", "c0", "c1", "c2")
+
+    def __init__(self, space: str, c0: ndarray, c1: ndarray, c2: ndarray) -> None:
+        """
+        :param space: name of the color space, as in ``colors.utils.color_spaces``
+        :param c0: first channel
+        :param c1: second channel
+        :param c2: third channel
+        """
+        self.space = space
+        self.c0 = c0
+        self.c1 = c1
+        self.c2 = c2
+
+    def __repr__(self) -> str:
+        return f"BatchColor({self.space}, shape={self.c0.shape})"
+
+    @classmethod
+    def from_array(cls, space: str, arr: ndarray) -> "BatchColor":
+        return cls(
+            space,
+            ascontiguousarray(arr[..., 0]),
+            ascontiguousarray(arr[..., 1]),
+            ascontiguousarray(arr[..., 2]),
+        )
+
+    def to_array(self) -> ndarray:
+        return stack((self.c0, self.c1, self.c2), axis=-1)
+
+    def to(self, space: str) -> "BatchColor":
+        """
+        Convert to another color space, chaining direct conversions as needed.
+
+        :param space: name of the target color space
+        :return: a new ``BatchColor``
+        """
+        path = route(_conversions, self.space, space)
+        channels = self.c0, self.c1, self.c2
+        for src, dst in zip(path, path[1:]):
+            channels = _conversions[src, dst](*channels)
+        return BatchColor(space, *channels)
+
+
+def srgb_to_xyz(arr: ndarray) -> ndarray:
+    """
+    Convert an ``(..., 3)`` array of sRGB values to XYZ.
+
+    :param arr: sRGB values, e.g. an ``(N, 3)`` palette or ``(H, W, 3)`` image;
+        float32 input is computed and returned as float32, anything else as float64
+    :return: XYZ values with the same shape as ``arr``
+    """
+    arr = _floating(arr)
+    return gamma_expand(arr) @ (
+        _M_RGB2XYZ_T32 if arr.dtype == float32 else _M_RGB2XYZ_T
+    )
+
+
+def xyz_to_srgb(arr: ndarray) -> ndarray:
+    """
+    Convert an ``(..., 3)`` array of XYZ values to sRGB.
+
+    :param arr: XYZ values
+    :return: sRGB values with the same shape as ``arr``
+    """
+    arr = _floating(arr)
+    return gamma_compress(
+        arr @ (_M_XYZ2RGB_T32 if arr.dtype == float32 else _M_XYZ2RGB_T)
+    )
+
+
+def xyz_to_cielab(arr: ndarray) -> ndarray:
+    """
+    Convert an ``(..., 3)`` array of XYZ values to CIELab.
+
+    :param arr: XYZ values
+    :return: CIELab values with the same shape as ``arr``
+    """
+    return stack(_xyz_to_cielab(arr[..., 0], arr[..., 1], arr[..., 2]), axis=-1)
+
+
+def cielab_to_xyz(arr: ndarray) -> ndarray:
+    """
+    Convert an ``(..., 3)`` array of CIELab values to XYZ.
+
+    :param arr: CIELab values
+    :return: XYZ values with the same shape as ``arr``
+    """
+    return stack(_cielab_to_xyz(arr[..., 0], arr[..., 1], arr[..., 2]), axis=-1)
+
+
+def srgb_to_lab(arr: ndarray, out: Optional[ndarray] = None) -> ndarray:
+    """
+    Convert an ``(..., 3)`` array of sRGB values straight to CIELab.
+
+    With numba installed this is a single fused pass (gamma, matrix and ``f()`` per
+    pixel) that writes into ``out`` without allocating intermediates. Otherwise the
+    NumPy stages run tile by tile so their temporaries stay in cache.
+
+    :param arr: sRGB values
+    :param out: optional C-contiguous array of the same shape to write into
+    :return: CIELab values with the same shape as ``arr``
+    """
+    arr = _floating(arr)
+    if out is None:
+        out = empty(arr.shape, arr.dtype)
+    elif out.shape != arr.shape or not out.flags.c_contiguous:
+        # A reshape of a non-contiguous out would silently write into a copy.
+        raise ValueError("out must be a C-contiguous array with the shape of arr")
+    flat = arr.reshape(-1, 3)
+    lab = out.reshape(-1, 3)
+    if NUMBA:
+        srgb_to_lab_fused(
+            flat[:, 0], flat[:, 1], flat[:, 2], lab[:, 0], lab[:, 1], lab[:, 2]
+        )
+        return out
+    for i in range(0, flat.shape[0], _TILE):
+        lab[i : i + _TILE] = xyz_to_cielab(srgb_to_xyz(flat[i : i + _TILE]))
+    return out
+
+
+def hsv_to_srgb(arr: ndarray) -> ndarray:
+    """
+    Convert an ``(..., 3)`` array of HSV values to sRGB.
+
+    :param arr: HSV values, hue in degrees
+    :return: sRGB values with the same shape as ``arr``
+    """
+    return stack(_hsv_to_srgb(arr[..., 0], arr[..., 1], arr[..., 2]), axis=-1)
+
+
+# Fixed-point tables for srgb8_to_lab8. Values are Q15 (1.0 == 1 << 15). The D65
+# normalization is folded into the matrix rows, whose coefficients then all fit in
+# int16, and f() is tabulated over every Q15 value of t in [0, 1].
+_Q = 15
+_GAMMA8 = rint(gamma_expand(linspace(0, 1, 256)) * (1 << _Q)).astype(uint16)
+_M_RGB2T_Q15 = rint(
+    _M_RGB2XYZ_T / array([D65X, D65Y, D65Z]) * (1 << _Q)
+).astype(int32)
+_F_Q15 = rint(lab_f(linspace(0, 1, (1 << _Q) + 1)) * (1 << _Q)).astype(uint16)
+
+
+def srgb8_to_lab8(arr: ndarray) -> ndarray:
+    """
+    Convert an ``(..., 3)`` uint8 sRGB image to 8-bit CIELab using integer math only.
+
+    Output uses the common 8-bit Lab layout: ``L * 255 / 100`` and ``a + 128``,
+    ``b + 128``, each rounded and clipped to ``0..255``.
+
+    :param arr: uint8 sRGB values
+    :return: uint8 Lab values with the same shape as ``arr``
+    """
+    half = 1 << (_Q - 1)
+    lin = _GAMMA8[arr].astype(int32)
+    t = (lin @ _M_RGB2T_Q15 + half) >> _Q
+    ft = _F_Q15[clip(t, 0, 1 << _Q)].astype(int64)
+    fx, fy, fz = ft[..., 0], ft[..., 1], ft[..., 2]
+    _L = (116 * 255 * fy - 16 * 255 * (1 << _Q) + 50 * (1 << _Q)) // (100 << _Q)
+    a = (500 * (fx - fy) + (128 << _Q) + half) >> _Q
+    b = (200 * (fy - fz) + (128 << _Q) + half) >> _Q
+    return clip(stack((_L, a, b), axis=-1), 0, 255).astype(uint8)
@@ -1,9 +1,9 @@
+from .pipeline import Chain, compile_chain
 from .utils import color_spaces
 
 
 class Color:
-    def __new__(cls, *args, **kwargs) -> "Color":
-        return super().__new__(cls)
+    __slots__ = ("_color", "_space")
 
     def __init__(self, space: str, values: tuple[float, float, float]) -> None:
         """
@@ -13,6 +13,7 @@ class Color:
         :param values:
         """
         self._color = color_spaces[space](values)
+        self._space = space
 
     def __repr__(self) -> str:
         return f"Color({self.space}, {self.values})"
@@ -20,9 +21,21 @@ class Color:
     def __str__(self) -> str:
         return str(self._color)
 
+    @staticmethod
+    def pipeline(src: str, dst: str, vectorized: bool = False) -> Chain:
+        """
+        Specialized ``src`` -> ``dst`` conversion function; see ``compile_chain``.
+
+        :param src: name of the source color space
+        :param dst: name of the target color space
+        :param vectorized: build the array version instead of the scalar one
+        :return: ``f(c0, c1, c2) -> (c0, c1, c2)``
+        """
+        return compile_chain(src, dst, vectorized)
+
     @property
     def space(self) -> str:
-        return self._color.__class__.__name__
+        return self._space
 
     @property
     def values(self) -> tuple[float, float, float]:
@@ -0,0 +1,62 @@
+from typing import Optional
+
+import cupy as cp
+
+from ._constants import D65X, D65Y, D65Z, M_RGB2XYZ
+
+_preamble = """
+template <typename T> __device__ T gamma_expand(T c) {
+    return c <= (T)0.04045 ? c / (T)12.92 : pow((c + (T)0.055) / (T)1.055, (T)2.4);
+}
+
+template <typename T> __device__ T lab_f(T t) {
+    return t > (T)(216.0 / 24389.0) ? cbrt(t)
+                                     : (T)(841.0 / 108.0) * t + (T)(4.0 / 29.0);
+}
+"""
+
+
+def _row(row: tuple[float, float, float], white: float) -> str:
+    return " + ".join(
+        f"(T){c / white!r} * {v}" for c, v in zip(row, ("r", "g", "bl"))
+    )
+
+
+# One thread per pixel: gamma, the RGB->XYZ matrix (pre-divided by the D65 white
+# point) and f() are all done in registers before L, a and b are written.
+_srgb_to_lab = cp.ElementwiseKernel(
+    "T R, T G, T B",
+    "T L, T a, T b",
+    f"""
+    T r = gamma_expand(R);
+    T g = gamma_expand(G);
+    T bl = gamma_expand(B);
+    T fx = lab_f({_row(M_RGB2XYZ[0], D65X)});
+    T fy = lab_f({_row(M_RGB2XYZ[1], D65Y)});
+    T fz = lab_f({_row(M_RGB2XYZ[2], D65Z)});
+    L = (T)116 * fy - (T)16;
+    a = (T)500 * (fx - fy);
+    b = (T)200 * (fy - fz);
+    """,
+    "colors_srgb_to_lab",
+    preamble=_preamble,
+)
+
+
+def srgb_to_lab(arr: cp.ndarray, out: Optional[cp.ndarray] = None) -> cp.ndarray:
+    """
+    Convert an ``(..., 3)`` CuPy array of sRGB values to CIELab on the GPU.
+
+    :param arr: sRGB values; float32 input is computed as float32, anything else as
+        float64
+    :param out: optional array of the same shape and dtype to write into
+    :return: CIELab values with the same shape as ``arr``
+    """
+    if arr.dtype != cp.float32:
+        arr = arr.astype(cp.float64, copy=False)
+    if out is None:
+        out = cp.empty_like(arr)
+    _srgb_to_lab(
+        arr[..., 0], arr[..., 1], arr[..., 2], out[..., 0], out[..., 1], out[..., 2]
+    )
+    return out
@@ -0,0 +1,194 @@
+from functools import lru_cache
+from math import atan2, cos, degrees, floor, isfinite, radians, sin, sqrt
+from typing import Callable
+
+from numpy import empty, float64, ndarray
+
+from ._constants import (
+    D65X,
+    D65Y,
+    D65Z,
+    HSV_SECTORS,
+    M_RGB2XYZ,
+    M_XYZ2RGB,
+    U_D65,
+    V_D65,
+)
+from ._kernels import NUMBA, njit, njit_cbrt, prange
+from ._routes import route
+
+(r0, r1, r2), (g0, g1, g2), (b0, b1, b2) = M_RGB2XYZ
+(x0, x1, x2), (y0, y1, y2), (z0, z1, z2) = M_XYZ2RGB
+
+# Source for each direct conversion. Every snippet reads the current color from
+# c0, c1, c2 and leaves the converted color in c0, c1, c2, so a chain is just the
+# snippets pasted one after another. Constants are inlined as literals.
+_conversions = {
+    ("sRGB", "XYZ"): f"""
+r = c0 / 12.92 if c0 <= 0.04045 else ((c0 + 0.055) / 1.055) ** 2.4
+g = c1 / 12.92 if c1 <= 0.04045 else ((c1 + 0.055) / 1.055) ** 2.4
+b = c2 / 12.92 if c2 <= 0.04045 else ((c2 + 0.055) / 1.055) ** 2.4
+c0 = {r0!r} * r + {r1!r} * g + {r2!r} * b
+c1 = {g0!r} * r + {g1!r} * g + {g2!r} * b
+c2 = {b0!r} * r + {b1!r} * g + {b2!r} * b
+""",
+    ("XYZ", "sRGB"): f"""
+r = {x0!r} * c0 + {x1!r} * c1 + {x2!r} * c2
+g = {y0!r} * c0 + {y1!r} * c1 + {y2!r} * c2
+b = {z0!r} * c0 + {z1!r} * c1 + {z2!r} * c2
+c0 = 12.92 * r if r <= 0.0031308 else 1.055 * r ** (1 / 2.4) - 0.055
+c1 = 12.92 * g if g <= 0.0031308 else 1.055 * g ** (1 / 2.4) - 0.055
+c2 = 12.92 * b if b <= 0.0031308 else 1.055 * b ** (1 / 2.4) - 0.055
+""",
+    ("XYZ", "CIELab"): f"""
+tx = c0 / {D65X!r}
+ty = c1 / {D65Y!r}
+tz = c2 / {D65Z!r}
+fx = cbrt(tx) if tx > 216 / 24389 else 841 / 108 * tx + 4 / 29
+fy = cbrt(ty) if ty > 216 / 24389 else 841 / 108 * ty + 4 / 29
+fz = cbrt(tz) if tz > 216 / 24389 else 841 / 108 * tz + 4 / 29
+c0, c1, c2 = 116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)
+""",
+    ("CIELab", "XYZ"): f"""
+fy = (c0 + 16) / 116
+fx = fy + c1 / 500
+fz = fy - c2 / 200
+c0 = {D65X!r} * (fx * fx * fx if fx > 6 / 29 else 108 / 841 * (fx - 4 / 29))
+c1 = {D65Y!r} * (fy * fy * fy if fy > 6 / 29 else 108 / 841 * (fy - 4 / 29))
+c2 = {D65Z!r} * (fz * fz * fz if fz > 6 / 29 else 108 / 841 * (fz - 4 / 29))
+""",
+    ("XYZ", "CIELuv"): f"""
+y = c1 / {D65Y!r}
+L = 116 * cbrt(y) - 16 if y > 216 / 24389 else 24389 / 27 * y
+s = c0 + 15 * c1 + 3 * c2
+c0, c1, c2 = L, 13 * L * (4 * c0 / s - {U_D65!r}), 13 * L * (9 * c1 / s - {V_D65!r})
+""",
+    ("CIELuv", "XYZ"): f"""
+k = (c0 + 16) / 116
+Y = k * k * k if c0 > 8 else c0 * 27 / 24389
+a = 1 / 3 * ((52 * c0) / (c1 + 13 * c0 * {U_D65!r}) - 1)
+b = -5 * Y
+d = Y * ((39 * c0) / (c2 + 13 * c0 * {V_D65!r}) - 5)
+X = (d - b) / (a + 1 / 3)
+c0, c1, c2 = X, Y, X * a + b
+""",
+    ("XYZ", "xyY"): """
+s = c0 + c1 + c2
+c0, c1, c2 = c0 / s, c1 / s, c1
+""",
+    ("xyY", "XYZ"): """
+c0, c1, c2 = c0 * c2 / c1, c2, (1 - c0 - c1) * c2 / c1
+""",
+    ("sRGB", "HSV"): """
+mx = max(c0, c1, c2)
+ch = mx - min(c0, c1, c2)
+if ch == 0:
+    h = 0.0
+elif mx == c0:
+    h = 60 * ((c1 - c2) / ch % 6)
+elif mx == c1:
+    h = 60 * ((c2 - c0) / ch + 2)
+else:
+    h = 60 * ((c0 - c1) / ch + 4)
+c0, c1, c2 = h, 0.0 if mx == 0 else ch / mx, mx
+""",
+    ("HSV", "sRGB"): """
+ch = float(c2 * c1)
+hp = c0 / 60
+triple = (ch, ch * (1 - abs(hp % 2 - 1)), 0.0)
+m = c2 - ch
+i0, i1, i2 = HSV_SECTORS[floor(hp) % 6 if isfinite(hp) else 5]
+c0, c1, c2 = triple[i0] + m, triple[i1] + m, triple[i2] + m
+""",
+}
+for _ucs in ("CIELab", "CIELuv"):
+    _conversions[_ucs, "LCh"] = """
+h = degrees(atan2(c2, c1))
+h = h + 360 if h < 0 else h
+c1, c2 = sqrt(c1 * c1 + c2 * c2), h
+"""
+    _conversions["LCh", _ucs] = """
+h = radians(c2)
+c1, c2 = c1 * cos(h), c1 * sin(h)
+"""
+
+_namespace = {
+    "HSV_SECTORS": HSV_SECTORS,
+    "atan2": atan2,
+    "cbrt": njit_cbrt,
+    "cos": cos,
+    "degrees": degrees,
+    "floor": floor,
+    "isfinite": isfinite,
+    "prange": prange,
+    "radians": radians,
+    "sin": sin,
+    "sqrt": sqrt,
+}
+
+_spaces = {space for pair in _conversions for space in pair}
+
+Chain = Callable[..., tuple]
+
+
+def _source(route: list[str]) -> str:
+    body = "".join(_conversions[src, dst] for src, dst in zip(route, route[1:]))
+    body = "".join(f"    {line}\n" for line in body.strip().splitlines())
+    return f"def _chain(c0, c1, c2):\n{body}    return c0, c1, c2\n"
+
+
+@lru_cache(maxsize=None)
+def compile_chain(src: str, dst: str, vectorized: bool = False) -> Chain:
+    """
+    Build one function that converts from ``src`` to ``dst`` in a single call.
+
+    The direct conversions along the shortest route are pasted together into one
+    function body and ``exec``'d, so there is no per-step dispatch and no
+    intermediate ``ColorSpace`` objects. With numba installed the result is
+    ``njit``-compiled. Results are cached per ``(src, dst, vectorized)``.
+
+    :param src: name of the source color space
+    :param dst: name of the target color space
+    :param vectorized: if true, the function takes three channel arrays of the same
+        shape and returns three new float64 arrays
+    :return: ``f(c0, c1, c2) -> (c0, c1, c2)``
+    :raises ValueError: if either name is not a known color space, or there is no
+        route between them
+    """
+    for space in (src, dst):
+        if space not in _spaces:
+            raise ValueError(f"Unknown color space: {space!r}")
+    name = f"{src}_to_{dst}"
+    namespace = dict(_namespace)
+    exec(_source(route(_conversions, src, dst)), namespace)
+    function = namespace["_chain"]
+    function.__name__ = function.__qualname__ = name
+    scalar = njit(function)
+    if not vectorized:
+        return scalar
+
+    namespace["_chain"] = scalar
+    exec(
+        "def _loop(a0, a1, a2, o0, o1, o2):\n"
+        "    for i in prange(a0.shape[0]):\n"
+        "        o0[i], o1[i], o2[i] = _chain(a0[i], a1[i], a2[i])\n",
+        namespace,
+    )
+    function = namespace["_loop"]
+    function.__name__ = function.__qualname__ = f"{name}_loop"
+    loop = njit(parallel=NUMBA)(function)
+
+    def chain(c0: ndarray, c1: ndarray, c2: ndarray) -> tuple:
+        shape = c0.shape
+        out = empty((3, c0.size), float64)
+        loop(
+            c0.astype(float64, copy=False).ravel(),
+            c1.astype(float64, copy=False).ravel(),
+            c2.astype(float64, copy=False).ravel(),
+            out[0],
+            out[1],
+            out[2],
+        )
+        return out[0].reshape(shape), out[1].reshape(shape), out[2].reshape(shape)
+
+    return chain
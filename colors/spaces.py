@@ -1,11 +1,65 @@
 from abc import ABC
+from functools import lru_cache
 from math import atan2, cos, degrees, radians, sin, sqrt
-from typing import cast, TypeVar
-
-from numpy import array
+from typing import Callable, TypeVar, Union
+
+from numpy import ndarray
+
+from ._constants import D65X, D65Y, D65Z, U_D65, V_D65
+from ._kernels import (
+    cbrt,
+    gamma_compress as compress,
+    gamma_expand as expand,
+    hsv_to_srgb,
+    lab_to_xyz,
+    srgb_to_hsv,
+    xyz_to_lab,
+    xyz_to_srgb as _xyz_to_srgb,
+)
+from .batch import (
+    cielab_to_xyz,
+    gamma_compress as batch_gamma_compress,
+    gamma_expand as batch_gamma_expand,
+    hsv_to_srgb as batch_hsv_to_srgb,
+    lab_f,
+    lab_f_inv,
+    srgb_to_xyz,
+    xyz_to_cielab,
+    xyz_to_srgb,
+)
+
+try:
+    from ._ext import srgb_to_xyz as _srgb_to_xyz
+except ImportError:  # the C extension is optional
+    from ._kernels import srgb_to_xyz as _srgb_to_xyz
+
+# Palettes and gradients keep converting the same handful of colors, so the scalar
+# conversions are memoized on their three input floats. The white point is a
+# constant, so the caches never need clearing.
+def _memoize(kernel: Callable) -> Callable:
+    cached = lru_cache(maxsize=2048)(kernel)
+
+    def convert(*values):
+        try:
+            return cached(*values)
+        except TypeError:  # unhashable components, e.g. 0-d arrays
+            return kernel(*values)
+
+    convert.cache_info = cached.cache_info
+    return convert
+
+
+_xyz_from_lab = _memoize(lab_to_xyz)
+_lab_from_xyz = _memoize(xyz_to_lab)
+_xyz_from_srgb = _memoize(_srgb_to_xyz)
+_srgb_from_xyz = _memoize(_xyz_to_srgb)
+_srgb_from_hsv = _memoize(hsv_to_srgb)
+_hsv_from_srgb = _memoize(srgb_to_hsv)
 
 
 class ColorSpace(ABC):
+    __slots__ = ("values",)
+
     def __init__(self, values: tuple[float, float, float]) -> None:
         self.values = values
 
@@ -14,6 +68,8 @@ class ColorSpace(ABC):
 
 
 class XYZ(ColorSpace):
+    __slots__ = ()
+
     @property
     def xyY(self) -> "xyY":  # noqa N801
         return xyY.from_XYZ(self)
@@ -37,43 +93,36 @@ class XYZ(ColorSpace):
 
     @classmethod
     def from_CIELab(cls, cielab: "CIELab") -> "XYZ":  # noqa N801
-        _L, _a, _b = cielab.values
-        _X = D65.values[0] * cielab.f_inv((_L + 16) / 116 + _a / 500)
-        _Y = D65.values[1] * cielab.f_inv((_L + 16) / 116)
-        _Z = D65.values[2] * cielab.f_inv((_L + 16) / 116 - _b / 200)
-        return cls((_X, _Y, _Z))
+        if isinstance(cielab.values, ndarray):
+            return cls(cielab_to_xyz(cielab.values))
+        return cls(_xyz_from_lab(*cielab.values))
 
     @classmethod
     def from_CIELuv(cls, cieluv: "CIELuv") -> "XYZ":  # noqa N801
         _L, u, v = cieluv.values
-        u_0 = cieluv.u_prime(D65)
-        v_0 = cieluv.v_prime(D65)
-        _Y = ((_L + 16) / 116) ** 3 if _L > 8 else _L * 27 / 24389
-        a = 1 / 3 * ((52 * _L) / (u + 13 * _L * u_0) - 1)
+        k = (_L + 16) / 116
+        _Y = k * k * k if _L > 8 else _L * 27 / 24389
+        a = 1 / 3 * ((52 * _L) / (u + 13 * _L * U_D65) - 1)
         b = -5 * _Y
         c = -1 / 3
-        d = _Y * ((39 * _L) / (v + 13 * _L * v_0) - 5)
+        d = _Y * ((39 * _L) / (v + 13 * _L * V_D65) - 5)
         _X = (d - b) / (a - c)
         _Z = _X * a + b
         return cls((_X, _Y, _Z))
 
     @classmethod
     def from_sRGB(cls, srgb: "sRGB") -> "XYZ":  # noqa N801
-        _M = array(
-            [
-                [0.4124564, 0.3575761, 0.1804375],
-                [0.2126729, 0.7151522, 0.0721750],
-                [0.0193339, 0.1191920, 0.9503041],
-            ]
-        )
-        srgb = array(srgb.gamma_expand().values)
-        return cls(cast(tuple[float, float, float], tuple(_M @ srgb)))
+        if isinstance(srgb.values, ndarray):
+            return cls(srgb_to_xyz(srgb.values))
+        return cls(_xyz_from_srgb(*srgb.values))
 
 
-D65 = XYZ((0.95047, 1.0, 1.08883))
+D65 = XYZ((D65X, D65Y, D65Z))
 
 
 class xyY(ColorSpace):  # noqa N801
+    __slots__ = ()
+
     @property
     def XYZ(self) -> "XYZ":  # noqa N801
         return XYZ.from_xyY(self)
@@ -89,10 +138,12 @@ UCS = TypeVar("UCS", bound="UniformColorSpace")
 
 
 class UniformColorSpace(ColorSpace):
+    __slots__ = ()
+
     @property
     def LCh(self) -> "LCh":  # noqa N801
         _L, x, y = self.values
-        _C = sqrt(x**2 + y**2)
+        _C = sqrt(x * x + y * y)
         h = degrees(atan2(y, x))
         if h < 0:
             h += 360
@@ -104,50 +155,67 @@ class UniformColorSpace(ColorSpace):
         h = radians(h)
         return cls((_L, _C * cos(h), _C * sin(h)))
 
+    @property
+    def LChFast(self) -> "LChFast":  # noqa N801
+        _L, x, y = self.values
+        _C = sqrt(x * x + y * y)
+        inv = 1 / _C if _C else 0.0
+        return LChFast((_L, _C, x * inv, y * inv))
+
+    @classmethod
+    def from_LChFast(cls, lch: "LChFast") -> UCS:  # noqa N801
+        _L, _C, cos_h, sin_h = lch.values
+        return cls((_L, _C * cos_h, _C * sin_h))
+
 
 class CIELab(UniformColorSpace):
+    __slots__ = ()
+
     @property
     def XYZ(self):  # noqa N801
         return XYZ.from_CIELab(self)
 
     @classmethod
     def from_XYZ(cls, xyz: "XYZ") -> "CIELab":  # noqa N801
-        fx, fy, fz = map(cls.f, (xyz.values[i] / D65.values[i] for i in range(3)))
-        return cls(
-            (
-                116 * fy - 16,
-                500 * (fx - fy),
-                200 * (fy - fz),
-            )
-        )
+        if isinstance(xyz.values, ndarray):
+            return cls(xyz_to_cielab(xyz.values))
+        return cls(_lab_from_xyz(*xyz.values))
 
     @staticmethod
-    def f(t: float) -> float:
+    def f(t: Union[float, ndarray]) -> Union[float, ndarray]:
+        if isinstance(t, ndarray):
+            return lab_f(t)
         if t > 216 / 24389:
-            return t ** (1 / 3)
+            return cbrt(t)
         return 841 / 108 * t + 4 / 29
 
     @staticmethod
-    def f_inv(t: float) -> float:
+    def f_inv(t: Union[float, ndarray]) -> Union[float, ndarray]:
+        if isinstance(t, ndarray):
+            return lab_f_inv(t)
         if t > 6 / 29:
-            return t**3
+            return t * t * t
         return 108 / 841 * (t - 4 / 29)
 
 
 class CIELuv(UniformColorSpace):
+    __slots__ = ()
+
     @property
     def XYZ(self):  # noqa N801
         return XYZ.from_CIELuv(self)
 
     @classmethod
     def from_XYZ(cls, xyz: "XYZ") -> "CIELuv":  # noqa N801
-        if xyz.values[1] > 216 / 24389:
-            _Y = xyz.values[1] / D65.values[1]
-            _L = 116 * _Y ** (1 / 3) - 16
+        _X, _Y, _Z = xyz.values
+        y = _Y / D65Y
+        if y > 216 / 24389:
+            _L = 116 * cbrt(y) - 16
         else:
-            _L = 24389 / 27 * xyz.values[1] / D65.values[1]
-        u = 13 * _L * (cls.u_prime(xyz) - cls.u_prime(D65))
-        v = 13 * _L * (cls.v_prime(xyz) - cls.v_prime(D65))
+            _L = 24389 / 27 * y
+        s = _X + 15 * _Y + 3 * _Z
+        u = 13 * _L * (4 * _X / s - U_D65)
+        v = 13 * _L * (9 * _Y / s - V_D65)
         return cls((_L, u, v))
 
     @staticmethod
@@ -162,6 +230,8 @@ class CIELuv(UniformColorSpace):
 
 
 class LCh(ColorSpace):
+    __slots__ = ()
+
     @property
     def CIELab(self) -> "CIELab":  # noqa N801
         return CIELab.from_LCh(self)
@@ -171,82 +241,81 @@ class LCh(ColorSpace):
         return CIELuv.from_LCh(self)
 
 
+class LChFast(ColorSpace):
+    """
+    LCh with the hue kept as ``(cos h, sin h)`` instead of an angle.
+
+    Values are ``(L, C, cos_h, sin_h)``. Going to and from the uniform space needs no
+    trigonometry; the hue angle is only computed when ``h`` or ``LCh`` is read.
+    """
+
+    __slots__ = ()
+
+    @property
+    def h(self) -> float:
+        _, _, cos_h, sin_h = self.values
+        h = degrees(atan2(sin_h, cos_h))
+        if h < 0:
+            h += 360
+        return h
+
+    @property
+    def LCh(self) -> "LCh":  # noqa N801
+        _L, _C, _, _ = self.values
+        return LCh((_L, _C, self.h))
+
+    @property
+    def CIELab(self) -> "CIELab":  # noqa N801
+        return CIELab.from_LChFast(self)
+
+    @property
+    def CIELuv(self) -> "CIELuv":  # noqa N801
+        return CIELuv.from_LChFast(self)
+
+
 class sRGB(ColorSpace):  # noqa N801
+    __slots__ = ()
+
     @property
     def XYZ(self) -> "XYZ":  # noqa N801
         return XYZ.from_sRGB(self)
 
     @property
     def HSV(self):  # noqa N801
-        _R, _G, _B = self.values
-        _M = max(_R, _G, _B)
-        m = min(_R, _G, _B)
-        _C = _M - m
-        if _C == 0:
-            _H = 0
-        elif _M == _R:
-            _H = 60 * ((_G - _B) / _C % 6)
-        elif _M == _G:
-            _H = 60 * ((_B - _R) / _C + 2)
-        else:
-            _H = 60 * ((_R - _G) / _C + 4)
-        _V = _M
-        _S = 0 if _M == 0 else _C / _M
-        return HSV((_H, _S, _V))
+        return HSV(_hsv_from_srgb(*self.values))
 
     def gamma_expand(self) -> "sRGB":
-        def expand(c: float) -> float:
-            if c <= 0.04045:
-                return c / 12.92
-            return ((c + 0.055) / 1.055) ** 2.4
-
-        self.values = tuple(map(expand, self.values))
+        if isinstance(self.values, ndarray):
+            self.values = batch_gamma_expand(self.values)
+            return self
+        _R, _G, _B = self.values
+        self.values = (expand(_R), expand(_G), expand(_B))
         return self
 
     def gamma_compress(self) -> "sRGB":
-        def compress(c: float) -> float:
-            if c <= 0.0031308:
-                return 12.92 * c
-            return 1.055 * c ** (1 / 2.4) - 0.055
-
-        self.values = tuple(map(compress, self.values))
+        if isinstance(self.values, ndarray):
+            self.values = batch_gamma_compress(self.values)
+            return self
+        _R, _G, _B = self.values
+        self.values = (compress(_R), compress(_G), compress(_B))
         return self
 
     @classmethod
     def from_XYZ(cls, xyz: "XYZ") -> "sRGB":  # noqa N801
-        _M = array(
-            [
-                [3.2404542, -1.5371385, -0.4985314],
-                [-0.9692660, 1.8760108, 0.0415560],
-                [0.0556434, -0.2040259, 1.0572252],
-            ]
-        )
-        xyz = array(xyz.values)
-        return cls(cast(tuple[float, float, float], tuple(_M @ xyz))).gamma_compress()
+        if isinstance(xyz.values, ndarray):
+            return cls(xyz_to_srgb(xyz.values))
+        return cls(_srgb_from_xyz(*xyz.values))
 
     @classmethod
     def from_HSV(cls, hsv: "HSV") -> "sRGB":  # noqa N801
-        _H, _S, _V = hsv.values
-        _C = _V * _S
-        _H /= 60
-        _X = _C * (1 - abs(_H % 2 - 1))
-        m = _V - _C
-        if _H < 1:
-            _R, _G, _B = _C, _X, 0
-        elif _H < 2:
-            _R, _G, _B = _X, _C, 0
-        elif _H < 3:
-            _R, _G, _B = 0, _C, _X
-        elif _H < 4:
-            _R, _G, _B = 0, _X, _C
-        elif _H < 5:
-            _R, _G, _B = _X, 0, _C
-        else:
-            _R, _G, _B = _C, 0, _X
-        return cls((_R + m, _G + m, _B + m))
+        if isinstance(hsv.values, ndarray):
+            return cls(batch_hsv_to_srgb(hsv.values))
+        return cls(_srgb_from_hsv(*hsv.values))
 
 
 class HSV(ColorSpace):
+    __slots__ = ()
+
     @property
     def sRGB(self) -> "sRGB":  # noqa N801
         return sRGB.from_HSV(self)
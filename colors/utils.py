@@ -4,17 +4,13 @@ from .spaces import (
     CIELab,
     CIELuv,
     LCh,
+    LChFast,
     sRGB,
     HSV,
 )
 
 
 color_spaces = {
-    "XYZ": XYZ,
-    "xyY": xyY,
-    "CIELab": CIELab,
-    "CIELuv": CIELuv,
-    "LCh": LCh,
-    "sRGB": sRGB,
-    "HSV": HSV,
+    space.__name__: space
+    for space in (XYZ, xyY, CIELab, CIELuv, LCh, LChFast, sRGB, HSV)
 }
@@ -1,4 +1,11 @@
-from setuptools import setup, find_packages
+from setuptools import Extension, setup, find_packages
+
+try:
+    from Cython.Build import cythonize
+except ImportError:  # the C extension is optional
+    ext_modules = []
+else:
+    ext_modules = cythonize([Extension("colors._ext", ["colors/_ext.pyx"])])
 
 setup(
     name="colors",
@@ -11,7 +18,12 @@ setup(
     url="https://github.com/yoonthegoon/colors",
     license="GPLv3",
     packages=find_packages(),
+    ext_modules=ext_modules,
     install_requires=[
         "numpy~=1.26.4",
     ],
+    extras_require={
+        "numba": ["numba>=0.59"],
+        "gpu": ["cupy"],
+    },
 )
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from colors import batch
+from colors.spaces import CIELab, HSV, XYZ, sRGB
+
+rng = np.random.default_rng(0)
+IMG = rng.random((4, 5, 3))
+
+
+def scalar(convert, arr):
+    return np.array([convert(tuple(v)) for v in arr.reshape(-1, 3)]).reshape(arr.shape)
+
+
+def test_srgb_xyz_matches_scalar():
+    xyz = scalar(lambda v: sRGB(v).XYZ.values, IMG)
+    assert np.allclose(batch.srgb_to_xyz(IMG), xyz)
+    srgb = scalar(lambda v: XYZ(v).sRGB.values, xyz)
+    assert np.allclose(batch.xyz_to_srgb(xyz), srgb)
+
+
+def test_cielab_matches_scalar():
+    xyz = batch.srgb_to_xyz(IMG)
+    lab = scalar(lambda v: XYZ(v).CIELab.values, xyz)
+    assert np.allclose(batch.xyz_to_cielab(xyz), lab)
+    back = scalar(lambda v: CIELab(v).XYZ.values, lab)
+    assert np.allclose(batch.cielab_to_xyz(lab), back)
+    assert np.allclose(batch.srgb_to_lab(IMG), lab)
+
+
+def test_hsv_matches_scalar():
+    hsv = IMG * [360, 1, 1]
+    srgb = scalar(lambda v: HSV(v).sRGB.values, hsv)
+    assert np.allclose(batch.hsv_to_srgb(hsv), srgb)
+
+
+def test_negative_hue_wraps():
+    hsv = IMG * [720, 1, 1] - [360, 0, 0]
+    srgb = scalar(lambda v: HSV(v).sRGB.values, hsv)
+    assert np.allclose(HSV((-30.0, 1.0, 1.0)).sRGB.values, (1, 0, 0.5))
+    assert np.allclose(batch.hsv_to_srgb(hsv), srgb)
+    assert np.allclose(batch.hsv_to_srgb(hsv + [360, 0, 0]), srgb)
+
+
+def test_ndarray_values_use_batch():
+    assert np.allclose(sRGB(IMG).XYZ.values, batch.srgb_to_xyz(IMG))
+    hsv = IMG * [360, 1, 1]
+    assert np.allclose(HSV(hsv).sRGB.values, batch.hsv_to_srgb(hsv))
+
+
+def test_batch_color_routes_through_xyz():
+    lab = batch.BatchColor.from_array("sRGB", IMG).to("CIELab")
+    assert np.allclose(lab.to_array(), batch.srgb_to_lab(IMG))
+    assert np.allclose(lab.to("sRGB").to_array(), IMG, atol=1e-5)
+
+
+def test_float32_stays_float32():
+    f32 = IMG.astype(np.float32)
+    for convert in (batch.srgb_to_xyz, batch.srgb_to_lab, batch.hsv_to_srgb):
+        assert convert(f32).dtype == np.float32
+        assert np.allclose(convert(f32), convert(IMG), atol=1e-3)
+
+
+def test_srgb_to_lab_writes_into_out():
+    out = np.empty_like(IMG)
+    assert batch.srgb_to_lab(IMG, out=out) is out
+    assert np.allclose(out, batch.srgb_to_lab(IMG))
+
+
+def test_srgb_to_lab_rejects_non_contiguous_out():
+    out = np.empty((3, 5, 4)).T
+    with pytest.raises(ValueError):
+        batch.srgb_to_lab(IMG, out=out)
+
+
+@pytest.mark.filterwarnings("ignore:invalid value:RuntimeWarning")
+def test_hsv_non_finite_hue():
+    hsv = np.array([[np.nan, 1, 1], [np.inf, 1, 1]])
+    srgb = batch.hsv_to_srgb(hsv)
+    assert np.array_equal(srgb[:, :2], [[1, 0], [1, 0]])
+    assert np.isnan(srgb[:, 2]).all()
+
+
+def test_batch_color_unknown_route():
+    with pytest.raises(ValueError):
+        batch.BatchColor.from_array("CIELab", IMG).to("HSV")
+
+
+def test_batch_color_fortran_ordered_channels():
+    channels = (IMG[..., 0].T, IMG[..., 1].T, IMG[..., 2].T)
+    lab = batch.BatchColor("sRGB", *channels).to("CIELab")
+    assert np.allclose(lab.to_array(), batch.srgb_to_lab(IMG).transpose(1, 0, 2))
+
+
+def test_srgb8_to_lab8_matches_float_path():
+    u8 = np.arange(1 << 24, dtype=np.uint32)[::97]
+    u8 = np.stack((u8 >> 16, (u8 >> 8) & 255, u8 & 255), axis=-1).astype(np.uint8)
+    lab = batch.srgb_to_lab(u8 / 255)
+    expected = np.stack((lab[:, 0] * 2.55, lab[:, 1] + 128, lab[:, 2] + 128), -1)
+    expected = np.clip(np.rint(expected), 0, 255)
+    lab8 = batch.srgb8_to_lab8(u8)
+    assert lab8.dtype == np.uint8
+    assert np.abs(lab8.astype(int) - expected).max() <= 1
+
+
+def test_srgb8_to_lab8_extremes():
+    lab8 = batch.srgb8_to_lab8(np.array([[0, 0, 0], [255, 255, 255]], np.uint8))
+    assert lab8.tolist() == [[0, 128, 128], [255, 128, 128]]
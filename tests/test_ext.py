@@ -0,0 +1,24 @@
+import math
+
+import pytest
+
+from colors import _kernels
+
+_ext = pytest.importorskip("colors._ext")
+
+
+def test_srgb_to_xyz_matches_exact_curve():
+    for i in range(1001):
+        c = i / 1000
+        expected = _kernels.srgb_to_xyz(c, c / 2, 1 - c)
+        assert _ext.srgb_to_xyz(c, c / 2, 1 - c) == pytest.approx(expected, abs=1e-6)
+
+
+@pytest.mark.parametrize("value", [-0.5, 1.0, 1.5, math.inf])
+def test_srgb_to_xyz_outside_lut(value):
+    expected = _kernels.srgb_to_xyz(value, 0.5, 0.5)
+    assert _ext.srgb_to_xyz(value, 0.5, 0.5) == pytest.approx(expected, abs=1e-6)
+
+
+def test_srgb_to_xyz_nan():
+    assert all(math.isnan(v) for v in _ext.srgb_to_xyz(math.nan, 0.5, 0.5))
@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from colors import batch
+
+cp = pytest.importorskip("cupy")
+
+try:
+    cp.cuda.runtime.getDeviceCount()
+except cp.cuda.runtime.CUDARuntimeError:
+    pytest.skip("no CUDA device", allow_module_level=True)
+
+from colors import gpu  # noqa: E402
+
+IMG = np.random.default_rng(0).random((64, 48, 3))
+
+
+@pytest.mark.parametrize("dtype, atol", [(np.float64, 1e-9), (np.float32, 1e-3)])
+def test_srgb_to_lab_matches_batch(dtype, atol):
+    arr = IMG.astype(dtype)
+    lab = gpu.srgb_to_lab(cp.asarray(arr))
+    assert lab.dtype == dtype
+    assert np.allclose(cp.asnumpy(lab), batch.srgb_to_lab(arr), atol=atol)
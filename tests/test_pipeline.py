@@ -0,0 +1,76 @@
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from colors import Color
+from colors._routes import route
+from colors.pipeline import _conversions, compile_chain
+from colors.utils import color_spaces
+
+try:
+    import colors._ext  # noqa F401
+except ImportError:
+    LUT = False
+else:
+    # XYZ.from_sRGB goes through the extension's gamma LUT, which is only accurate
+    # to about 2.4e-4 in CIELab; the generated chain always uses the exact curve.
+    LUT = True
+
+SPACES = ["sRGB", "XYZ", "CIELab", "CIELuv", "LCh", "xyY", "HSV"]
+RGB = np.random.default_rng(0).uniform(0.05, 1, (8, 3))
+
+
+def via_classes(path, values):
+    color = color_spaces[path[0]](tuple(values))
+    for dst in path[1:]:
+        color = getattr(color, dst)
+    return color.values
+
+
+@pytest.mark.parametrize("src, dst", list(itertools.permutations(SPACES, 2)))
+def test_chain_matches_classes(src, dst):
+    chain = compile_chain(src, dst)
+    assert chain.__name__ == f"{src}_to_{dst}"
+    path = route(_conversions, src, dst)
+    tolerance = {"rel": 1e-6}
+    if LUT and ("sRGB", "XYZ") in zip(path, path[1:]):
+        tolerance["abs"] = 5e-4
+    for rgb in RGB:
+        values = via_classes(route(_conversions, "sRGB", src), rgb)
+        assert chain(*values) == pytest.approx(via_classes(path, values), **tolerance)
+
+
+def test_vectorized_matches_scalar():
+    img = RGB.reshape(2, 4, 3)
+    out = Color.pipeline("sRGB", "LCh", vectorized=True)(*np.moveaxis(img, -1, 0))
+    assert all(o.shape == (2, 4) for o in out)
+    expected = [compile_chain("sRGB", "LCh")(*v) for v in RGB]
+    assert np.allclose(np.stack(out, -1).reshape(-1, 3), expected)
+
+
+@pytest.mark.parametrize(
+    "src, dst",
+    [
+        ("Lab", "XYZ"),
+        ("x", "x"),
+        ("sRGB", "sRGB(c0, c1, c2):\n    import os\ndef f"),
+    ],
+)
+def test_unknown_space_raises(src, dst):
+    with pytest.raises(ValueError):
+        compile_chain(src, dst)
+
+
+def test_hsv_negative_hue():
+    chain = compile_chain("HSV", "sRGB")
+    assert chain(-30.0, 1.0, 1.0) == pytest.approx((1, 0, 0.5))
+    assert chain(-30.0, 1.0, 1.0) == pytest.approx(chain(330.0, 1.0, 1.0))
+
+
+@pytest.mark.parametrize("hue", [math.nan, math.inf, -math.inf])
+def test_hsv_non_finite_hue(hue):
+    _R, _G, _B = compile_chain("HSV", "sRGB")(hue, 1.0, 1.0)
+    assert (_R, _G) == (1.0, 0.0)
+    assert math.isnan(_B)
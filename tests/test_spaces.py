@@ -0,0 +1,52 @@
+import math
+
+import numpy as np
+import pytest
+
+from colors import spaces
+from colors.spaces import CIELab, HSV, XYZ
+from colors.utils import color_spaces
+
+
+def test_single_spaces_module():
+    assert XYZ.from_CIELab.__qualname__.startswith("XYZ.")
+    for name, space in color_spaces.items():
+        assert space.__name__ == name
+        assert space is getattr(spaces, name)
+
+
+@pytest.mark.parametrize("hue", [math.nan, math.inf, -math.inf])
+def test_hsv_non_finite_hue(hue):
+    _R, _G, _B = HSV((hue, 1.0, 1.0)).sRGB.values
+    assert (_R, _G) == (1.0, 0.0)
+    assert math.isnan(_B)
+
+
+@pytest.mark.parametrize("lab", [(50.0, 20.0, -30.0), (75.0, -40.0, 10.0)])
+def test_lch_fast_round_trip(lab):
+    fast = CIELab(lab).LChFast
+    assert fast.CIELab.values == pytest.approx(lab)
+    lch = CIELab(lab).LCh
+    assert fast.h == pytest.approx(lch.values[2])
+    assert fast.LCh.values == pytest.approx(lch.values)
+
+
+def test_lch_fast_zero_chroma():
+    fast = CIELab((50.0, 0.0, 0.0)).LChFast
+    assert fast.values == (50.0, 0.0, 0.0, 0.0)
+    assert fast.h == 0
+    assert fast.CIELab.values == (50.0, 0.0, 0.0)
+
+
+def test_scalar_conversions_are_memoized():
+    xyz = (0.2, 0.3, 0.4)
+    lab = XYZ(xyz).CIELab.values
+    hits = spaces._lab_from_xyz.cache_info().hits
+    assert XYZ(xyz).CIELab.values == lab
+    assert spaces._lab_from_xyz.cache_info().hits == hits + 1
+
+
+def test_unhashable_components_skip_the_cache():
+    xyz = (0.2, 0.3, 0.4)
+    values = XYZ(tuple(np.array(v) for v in xyz)).CIELab.values
+    assert values == pytest.approx(XYZ(xyz).CIELab.values)